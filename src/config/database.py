@@ -0,0 +1,93 @@
+"""
+Database Connections
+Shared SQLAlchemy engine and bulk read/write helpers for the pipeline tasks
+"""
+
+import csv
+from io import StringIO
+from typing import Any, Iterable, List, Optional
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from config.settings import CONFIG
+
+try:
+    # Optional: Arrow-native reader over the binary Postgres protocol
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+_engine: Optional[Engine] = None
+
+
+def get_engine() -> Engine:
+    """
+    Return the process-wide SQLAlchemy engine, creating it on first use
+
+    The engine (and its connection pool) is built lazily so that importing
+    task modules during DAG parsing never opens a database connection, and
+    is then reused by every task that runs in the same worker process.
+
+    Returns:
+        SQLAlchemy engine bound to the inventory database
+    """
+    global _engine
+
+    if _engine is None:
+        _engine = create_engine(
+            CONFIG.INVENTORY_DB_URL,
+            pool_pre_ping=True,
+            pool_size=5
+        )
+
+    return _engine
+
+
+def read_sql(query: str) -> pd.DataFrame:
+    """
+    Run a read-only query and return the result as a DataFrame
+
+    Uses ConnectorX when it is installed, which decodes the binary wire
+    format straight into columnar buffers instead of building one Python
+    tuple per row; otherwise falls back to ``pd.read_sql`` on the shared
+    engine.
+
+    Args:
+        query: SQL query without bound parameters
+
+    Returns:
+        Query result
+    """
+    if cx is not None:
+        # ConnectorX takes a plain postgresql:// URL without a driver suffix
+        url = get_engine().url.set(drivername='postgresql')
+        return cx.read_sql(url.render_as_string(hide_password=False), query,
+                           return_type='pandas')
+
+    return pd.read_sql(query, get_engine())
+
+
+def psql_insert_copy(table: Any, conn: Any, keys: List[str], data_iter: Iterable) -> None:
+    """
+    Bulk-load rows with PostgreSQL COPY; pass as ``DataFrame.to_sql(method=...)``
+
+    Streams the rows as CSV through ``COPY ... FROM STDIN`` on the caller's
+    connection, so it joins any open transaction, instead of issuing
+    parameterized INSERT statements.
+
+    Args:
+        table: pandas SQLTable being written to
+        conn: SQLAlchemy connection supplied by ``to_sql``
+        keys: Column names, in row order
+        data_iter: Iterable of row tuples
+    """
+    buffer = StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH CSV', buffer)
@@ -4,7 +4,10 @@ Centralized configuration for the Inventory Optimization Pipeline
 """
 
 import os
-from typing import Dict, Any
+from bisect import bisect_left
+from dataclasses import make_dataclass
+from types import MappingProxyType
+from typing import Mapping, Any
 
 
 class Config:
@@ -23,6 +26,9 @@ class Config:
         'critical': 0.995  # 99.5% service level
     }
     
+    # Stock status categories, most to least urgent
+    STOCK_STATUS_LEVELS = ['critical', 'low', 'adequate', 'excess']
+    
     DEFAULT_LEAD_TIME_DAYS = int(os.getenv('DEFAULT_LEAD_TIME_DAYS', '7'))
     MIN_HISTORY_DAYS = int(os.getenv('MIN_HISTORY_DAYS', '30'))
     
@@ -44,6 +50,18 @@ class Config:
         'supervisor': {'threshold': 0, 'approvers': ['inventory_supervisor']}
     }
     
+    # Tiers pre-sorted by threshold so lookups can bisect instead of scanning
+    _TIERS_SORTED = sorted(
+        (tier['threshold'], level, tier['approvers'])
+        for level, tier in APPROVAL_TIERS.items()
+    )
+    _THRESHOLDS = [threshold for threshold, _, _ in _TIERS_SORTED]
+    # Read-only result per tier, built once and shared by every lookup
+    _TIER_RESULTS = tuple(
+        MappingProxyType({'level': level, 'approvers': approvers, 'threshold': threshold})
+        for threshold, level, approvers in _TIERS_SORTED
+    )
+    
     # Notification Configuration
     INVENTORY_TEAM_EMAILS = os.getenv('INVENTORY_TEAM_EMAILS', 'inventory@company.com')
     EXECUTIVE_EMAILS = os.getenv('EXECUTIVE_EMAILS', 'executives@company.com')
@@ -67,7 +85,7 @@ class Config:
     HISTORY_RETENTION_DAYS = int(os.getenv('HISTORY_RETENTION_DAYS', '90'))
     
     @classmethod
-    def get_approval_level(cls, total_value: float) -> Dict[str, Any]:
+    def get_approval_level(cls, total_value: float) -> Mapping[str, Any]:
         """
         Determine approval level based on total value
         
@@ -75,21 +93,13 @@ class Config:
             total_value: Total value of the request
             
         Returns:
-            Dictionary with approval level and required approvers
+            Read-only mapping with approval level and required approvers
         """
-        for level, config in cls.APPROVAL_TIERS.items():
-            if total_value > config['threshold']:
-                return {
-                    'level': level,
-                    'approvers': config['approvers'],
-                    'threshold': config['threshold']
-                }
+        # Highest tier whose threshold is strictly exceeded; values at or
+        # below the lowest threshold fall back to the lowest tier
+        idx = max(bisect_left(cls._THRESHOLDS, total_value) - 1, 0)
         
-        return {
-            'level': 'supervisor',
-            'approvers': cls.APPROVAL_TIERS['supervisor']['approvers'],
-            'threshold': 0
-        }
+        return cls._TIER_RESULTS[idx]
     
     @classmethod
     def validate_config(cls) -> bool:
@@ -111,4 +121,13 @@ class Config:
 
 
 # Validate configuration on import
-Config.validate_config()
\ No newline at end of file
+Config.validate_config()
+
+# Frozen, slotted snapshot of the validated settings for task code; attribute
+# reads skip the class MRO lookup and values cannot be reassigned at run time
+_SETTING_NAMES = [
+    name for name in vars(Config)
+    if name.isupper() and not name.startswith('_')
+]
+ConfigSnapshot = make_dataclass('ConfigSnapshot', _SETTING_NAMES, frozen=True, slots=True)
+CONFIG = ConfigSnapshot(**{name: getattr(Config, name) for name in _SETTING_NAMES})
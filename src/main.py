@@ -8,16 +8,8 @@ from airflow.sdk import dag, task, DAG
 from airflow.operators.python import PythonOperator
 from airflow.operators.empty import EmptyOperator
 
-# Import task modules
-from tasks.inventory_sync import (
-    fetch_realtime_inventory,
-    sync_warehouse_data,
-    sync_store_data
-)
-from tasks.safety_stock_calculator import calculate_safety_stock
-from tasks.reorder_engine import evaluate_reorder_thresholds
-from tasks.transfer_recommender import generate_transfer_recommendations
-from tasks.approval_workflow import submit_for_approval, notify_stakeholders
+# Task modules (and their pandas/SQLAlchemy imports) are imported inside each
+# task callable so that parsing this DAG file stays cheap for the scheduler
 
 
 default_args = {
@@ -58,50 +50,58 @@ def inventory_optimization_pipeline():
     start = EmptyOperator(task_id='start')
     
     # Task 1: Fetch real-time inventory feed
-    @task(task_id='fetch_inventory_feed', retries=5)
+    @task(task_id='fetch_inventory_feed', retries=5, multiple_outputs=True)
     def fetch_inventory():
         """Fetch real-time inventory data from source systems"""
+        from tasks.inventory_sync import fetch_realtime_inventory
         return fetch_realtime_inventory()
     
     # Task 2a & 2b: Parallel warehouse and store sync
     @task(task_id='sync_warehouses')
-    def sync_warehouses(inventory_data):
+    def sync_warehouses(warehouse_data):
         """Sync warehouse inventory data"""
-        return sync_warehouse_data(inventory_data)
+        from tasks.inventory_sync import sync_warehouse_data
+        return sync_warehouse_data(warehouse_data)
     
     @task(task_id='sync_stores')
-    def sync_stores(inventory_data):
+    def sync_stores(store_data):
         """Sync store inventory data"""
-        return sync_store_data(inventory_data)
+        from tasks.inventory_sync import sync_store_data
+        return sync_store_data(store_data)
     
     # Task 3: Calculate safety stock levels
     @task(task_id='calculate_safety_stock_levels')
     def calc_safety_stock(warehouse_data, store_data):
         """Calculate safety stock based on demand variability"""
+        from tasks.safety_stock_calculator import calculate_safety_stock
         return calculate_safety_stock(warehouse_data, store_data)
     
     # Task 4: Evaluate reorder thresholds
     @task(task_id='evaluate_reorder_thresholds')
     def evaluate_reorders(safety_stock_data):
         """Evaluate which items need reordering"""
+        from tasks.reorder_engine import evaluate_reorder_thresholds
         return evaluate_reorder_thresholds(safety_stock_data)
     
     # Task 5: Generate transfer recommendations
     @task(task_id='generate_transfer_recommendations')
     def generate_transfers(reorder_data):
         """Generate optimal transfer recommendations between locations"""
+        from tasks.transfer_recommender import generate_transfer_recommendations
         return generate_transfer_recommendations(reorder_data)
     
     # Task 6a: Submit for approval
     @task(task_id='submit_for_approval')
     def submit_approval(transfer_recommendations):
         """Submit recommendations to approval workflow"""
+        from tasks.approval_workflow import submit_for_approval
         return submit_for_approval(transfer_recommendations)
     
     # Task 6b: Notify stakeholders
     @task(task_id='notify_stakeholders')
     def notify(approval_data):
         """Notify relevant stakeholders of recommendations"""
+        from tasks.approval_workflow import notify_stakeholders
         return notify_stakeholders(approval_data)
     
     # End marker
@@ -110,9 +110,9 @@ def inventory_optimization_pipeline():
     # Define task dependencies
     inventory = fetch_inventory()
     
-    # Parallel sync operations
-    warehouses = sync_warehouses(inventory)
-    stores = sync_stores(inventory)
+    # Parallel sync operations, each pulling only its slice of the feed
+    warehouses = sync_warehouses(inventory['warehouse_data'])
+    stores = sync_stores(inventory['store_data'])
     
     # Sequential processing
     safety_stock = calc_safety_stock(warehouses, stores)
@@ -0,0 +1,9 @@
+"""
+Test configuration
+Puts src/ on sys.path so tests import modules the way the DAG does
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
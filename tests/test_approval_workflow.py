@@ -0,0 +1,46 @@
+"""
+Tests for the approval workflow
+"""
+
+import math
+
+from tasks import approval_workflow
+
+
+def test_approval_records_keep_only_their_own_fields():
+    transfers = approval_workflow._build_approval_frame(
+        {
+            'product_id': [1], 'from_location_id': ['A'], 'to_location_id': ['warehouse_central'],
+            'transfer_quantity': [12], 'transfer_cost': [30.0], 'priority': ['HIGH'],
+            'cost_savings': [20.0], 'reason': ['Excess'], 'estimated_transfer_days': [2]
+        },
+        'transfer',
+        approval_workflow._TRANSFER_APPROVAL_COLUMNS,
+        approval_workflow._TRANSFER_METADATA_COLUMNS
+    )
+    purchase_orders = approval_workflow._build_approval_frame(
+        {
+            'product_id': [2], 'supplier_id': [10], 'recommended_order_qty': [40],
+            'total_order_value': [200.0], 'priority_label': ['CRITICAL'],
+            'supplier_name': ['Acme'], 'lead_time_days': [7],
+            'expected_delivery_date': ['2026-01-08'], 'current_stock': [3.0],
+            'reorder_point': [20.0]
+        },
+        'purchase_order',
+        approval_workflow._PO_APPROVAL_COLUMNS,
+        approval_workflow._PO_METADATA_COLUMNS
+    )
+
+    transfer, purchase_order = approval_workflow._approval_records(
+        [transfers, purchase_orders], {'submission_id': 'S1', 'status': 'pending'}
+    )
+
+    assert 'supplier_id' not in transfer
+    assert 'from_location' not in purchase_order and 'to_location' not in purchase_order
+    assert purchase_order['supplier_id'] == 10 and isinstance(purchase_order['supplier_id'], int)
+    assert transfer['submission_id'] == purchase_order['submission_id'] == 'S1'
+    assert not any(
+        isinstance(value, float) and math.isnan(value)
+        for record in (transfer, purchase_order)
+        for value in record.values()
+    )
@@ -0,0 +1,65 @@
+"""
+Tests for the safety stock calculator
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from config.settings import CONFIG
+from tasks import safety_stock_calculator
+
+
+@pytest.fixture
+def demand(monkeypatch):
+    """Serve a fixed demand frame in place of the demand query"""
+    served = {}
+
+    monkeypatch.setattr(safety_stock_calculator, 'get_engine', lambda: None)
+    monkeypatch.setattr(
+        safety_stock_calculator.pd, 'read_sql', lambda query, engine: served['df'].copy()
+    )
+
+    def serve(rows):
+        served['df'] = pd.DataFrame(rows)
+
+    return serve
+
+
+def _calculate():
+    """Run the task against two products with no stock on hand"""
+    return safety_stock_calculator.calculate_safety_stock(
+        {'warehouse_summary': {'product_id': [], 'total_available': []}},
+        {'store_summary': {'product_id': [], 'total_available': []}}
+    )
+
+
+def test_safety_stock_uses_each_products_lead_time(demand):
+    demand([
+        {'product_id': 1, 'avg_daily_demand': 10.0, 'stddev_daily_demand': 4.0,
+         'max_daily_demand': 20.0, 'min_daily_demand': 1.0, 'days_of_history': 60,
+         'lead_time_days': 16.0},
+        {'product_id': 2, 'avg_daily_demand': 5.0, 'stddev_daily_demand': 2.0,
+         'max_daily_demand': 9.0, 'min_daily_demand': 1.0, 'days_of_history': 45,
+         'lead_time_days': None},
+    ])
+
+    result = _calculate()
+    safety_df = pd.DataFrame(result['safety_stock_data']).set_index('product_id')
+
+    # Product 2 has no recorded lead time and falls back to the default
+    default_lead_time = CONFIG.DEFAULT_LEAD_TIME_DAYS
+    assert safety_df['lead_time_days'].tolist() == [16.0, default_lead_time]
+    assert result['default_lead_time_days'] == default_lead_time
+
+    z_standard = safety_stock_calculator._Z_SCORES['standard']
+    expected_safety_stock = [
+        round(z_standard * 4.0 * math.sqrt(16)),
+        round(z_standard * 2.0 * math.sqrt(default_lead_time))
+    ]
+    assert safety_df['safety_stock_standard'].tolist() == expected_safety_stock
+    assert safety_df['reorder_point'].tolist() == [
+        round(10.0 * 16 + expected_safety_stock[0]),
+        round(5.0 * default_lead_time + expected_safety_stock[1])
+    ]
@@ -0,0 +1,226 @@
+"""
+Tests for the transfer recommendation engine
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.settings import CONFIG
+from tasks import transfer_recommender
+
+LOCATION_COLUMNS = [
+    'product_id', 'location_id', 'location_name', 'location_type', 'region',
+    'quantity_available', 'quantity_reserved', 'transferrable_qty'
+]
+
+
+def _reorder_payload(items):
+    """Build a column-wise reorder payload from a few item overrides"""
+    reorder_df = pd.DataFrame(items)
+    reorder_df['total_order_value'] = (
+        reorder_df['recommended_order_qty'] * reorder_df['unit_cost']
+    )
+    reorder_df['priority_label'] = 'HIGH'
+
+    return {
+        'reorder_recommendations': reorder_df.to_dict('list'),
+        'summary': {'total_order_value': float(reorder_df['total_order_value'].sum())}
+    }
+
+
+def _location_frame(rows):
+    """Build the location query result, typed the way an empty read comes back"""
+    if not rows:
+        return pd.DataFrame(columns=LOCATION_COLUMNS, dtype=object)
+
+    location_df = pd.DataFrame(rows)
+    location_df['location_name'] = 'Loc ' + location_df['location_id']
+    location_df['location_type'] = 'store'
+    location_df['region'] = 'R1'
+    location_df['quantity_available'] = location_df['transferrable_qty']
+    location_df['quantity_reserved'] = 0
+
+    return location_df[LOCATION_COLUMNS]
+
+
+@pytest.fixture
+def locations(monkeypatch):
+    """Serve a fixed location frame in place of the inventory query"""
+    served = {}
+
+    def fake_read_sql(query, engine, params=None):
+        df = served['df']
+        if params and len(df):
+            df = df[df['product_id'].isin(params['product_ids'])]
+        return df.copy()
+
+    monkeypatch.setattr(transfer_recommender, 'get_engine', lambda: None)
+    monkeypatch.setattr(transfer_recommender.pd, 'read_sql', fake_read_sql)
+
+    def serve(rows):
+        served['df'] = _location_frame(rows)
+
+    return serve
+
+
+def _sequential_greedy(items, rows):
+    """Reference allocation: offer each location's excess to its item in turn"""
+    transfers = []
+    purchase_orders = []
+
+    for item in items:
+        excess = sorted(
+            (
+                (max(row['transferrable_qty'] - item['avg_daily_demand'] * 14, 0), row['location_id'])
+                for row in rows
+                if row['product_id'] == item['product_id'] and row['transferrable_qty'] > 0
+            ),
+            key=lambda pair: -pair[0]
+        )
+        if not excess:
+            purchase_orders.append((item['product_id'], item['recommended_order_qty']))
+            continue
+
+        remaining = item['shortage_qty']
+        for excess_qty, location_id in excess:
+            if remaining <= 0:
+                break
+            offered = min(excess_qty, remaining)
+            if offered >= CONFIG.MIN_TRANSFER_QUANTITY:
+                cost_savings = offered * item['unit_cost'] - int(offered) * CONFIG.BASE_TRANSFER_COST_PER_UNIT
+                if cost_savings > 0:
+                    transfers.append((item['product_id'], location_id, int(offered)))
+                    remaining -= offered
+
+        if remaining > 0:
+            purchase_orders.append((item['product_id'], int(remaining)))
+
+    return transfers, purchase_orders
+
+
+def _allocation(result):
+    """Reduce a task result to comparable transfer and purchase order tuples"""
+    transfers = result['transfer_recommendations']
+    purchase_orders = result['purchase_order_recommendations']
+
+    return (
+        list(zip(transfers['product_id'], transfers['from_location_id'],
+                 transfers['transfer_quantity'])),
+        list(zip(purchase_orders['product_id'], purchase_orders['recommended_order_qty']))
+    )
+
+
+def test_cost_rejected_offer_leaves_shortage_for_next_location(locations):
+    # At 2.48/unit, 25 units cost more to transfer than to buy, so the
+    # largest location is skipped and the next one offers against the
+    # full shortage; a running total of excess would have capped it at 5
+    items = [{
+        'product_id': 1, 'recommended_order_qty': 40, 'shortage_qty': 30.0,
+        'avg_daily_demand': 0.0, 'unit_cost': 2.48
+    }]
+    rows = [
+        {'product_id': 1, 'location_id': 'A', 'transferrable_qty': 25.0},
+        {'product_id': 1, 'location_id': 'B', 'transferrable_qty': 12.3},
+    ]
+    locations(rows)
+
+    result = transfer_recommender.generate_transfer_recommendations(_reorder_payload(items))
+
+    assert _allocation(result) == ([(1, 'B', 12)], [(1, 17)])
+
+
+def test_allocation_matches_sequential_greedy(locations):
+    rng = np.random.default_rng(7)
+    items = [
+        {
+            'product_id': product_id,
+            'recommended_order_qty': int(rng.integers(10, 300)),
+            'shortage_qty': float(rng.integers(0, 200)),
+            'avg_daily_demand': float(rng.uniform(0, 10)),
+            # A share of items priced near the per-unit transfer cost
+            'unit_cost': float(rng.uniform(2.2, 2.6) if rng.random() < 0.3 else rng.uniform(1, 40))
+        }
+        for product_id in rng.permutation(40)
+    ]
+    rows = [
+        {'product_id': int(product_id), 'location_id': f'L{location}',
+         'transferrable_qty': float(rng.integers(-20, 250))}
+        for product_id in range(40)
+        for location in rng.choice(12, rng.integers(0, 6), replace=False)
+    ]
+    locations(rows)
+
+    result = transfer_recommender.generate_transfer_recommendations(_reorder_payload(items))
+
+    assert _allocation(result) == _sequential_greedy(items, rows)
+
+
+def test_no_transferrable_stock_keeps_every_purchase_order(locations):
+    items = [
+        {'product_id': 1, 'recommended_order_qty': 40, 'shortage_qty': 30.0,
+         'avg_daily_demand': 1.0, 'unit_cost': 5.0},
+        {'product_id': 2, 'recommended_order_qty': 15, 'shortage_qty': 12.0,
+         'avg_daily_demand': 2.0, 'unit_cost': 8.0},
+    ]
+    locations([])
+
+    result = transfer_recommender.generate_transfer_recommendations(_reorder_payload(items))
+
+    assert _allocation(result) == ([], [(1, 40), (2, 15)])
+    assert result['summary']['transfers_recommended'] == 0
+    assert result['summary']['purchase_orders_recommended'] == 2
+
+
+def test_empty_reorder_payload_keeps_column_names(locations):
+    payload = _reorder_payload([
+        {'product_id': 1, 'recommended_order_qty': 40, 'shortage_qty': 30.0,
+         'avg_daily_demand': 1.0, 'unit_cost': 5.0}
+    ])
+    empty = {
+        'reorder_recommendations': {field: [] for field in payload['reorder_recommendations']},
+        'summary': {'total_order_value': 0.0}
+    }
+    locations([])
+
+    full = transfer_recommender.generate_transfer_recommendations(payload)
+    result = transfer_recommender.generate_transfer_recommendations(empty)
+
+    assert result['transfer_recommendations'] == {
+        field: [] for field in full['transfer_recommendations']
+    }
+    assert result['purchase_order_recommendations'] == {
+        field: [] for field in full['purchase_order_recommendations']
+    }
+    assert list(result['summary']) == list(full['summary'])
+    assert not any(result['summary'].values())
+
+
+@pytest.mark.parametrize('product_ids', [
+    pd.Series([1, 2], dtype='int64'),
+    pd.Series([1, 2], dtype='Int64'),
+    pd.Series(['SKU-1', 'SKU-2'], dtype=object),
+], ids=['int64', 'nullable', 'string'])
+def test_empty_location_read_takes_reorder_id_dtype(locations, product_ids):
+    locations([])
+
+    location_df = transfer_recommender._read_transferrable_stock(product_ids)
+
+    assert location_df.empty
+    assert location_df['product_id'].dtype == product_ids.dtype
+    assert location_df['transferrable_qty'].dtype == np.float64
+
+
+def test_string_product_ids_allocate(locations):
+    items = [
+        {'product_id': 'SKU-1', 'recommended_order_qty': 40, 'shortage_qty': 30.0,
+         'avg_daily_demand': 1.0, 'unit_cost': 5.0},
+        {'product_id': 'SKU-2', 'recommended_order_qty': 15, 'shortage_qty': 12.0,
+         'avg_daily_demand': 2.0, 'unit_cost': 8.0},
+    ]
+    rows = [{'product_id': 'SKU-1', 'location_id': 'A', 'transferrable_qty': 50.0}]
+    locations(rows)
+
+    result = transfer_recommender.generate_transfer_recommendations(_reorder_payload(items))
+
+    assert _allocation(result) == _sequential_greedy(items, rows)